@@ -50,8 +50,10 @@ def get_input_callback(samplerate, params, num_samples=256):
             A number of samples (`num_samples`) of the sine.
         """
         start_time = 0
+        # the sample times within a chunk are the same on every call
+        offsets = np.arange(num_samples) / samplerate
         while True:
-            time = start_time + np.arange(num_samples) / samplerate
+            time = start_time + offsets
             start_time += num_samples / samplerate
             output = amplitude * np.cos(2 * np.pi * frequency * time)
             yield output
@@ -24,14 +24,17 @@
  * If not, see <https://opensource.org/licenses/MIT>.
  */
 
-#include <pybind11/functional.h>
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <samplerate.h>
 
+#include <algorithm>
 #include <cmath>
+#include <cstdint>
 #include <iostream>
+#include <memory>
+#include <mutex>
 #include <string>
 #include <typeinfo>
 #include <vector>
@@ -85,9 +88,6 @@ long gil_release_threshold_frames = 1000;
 namespace py = pybind11;
 using namespace pybind11::literals;
 
-using callback_t =
-    std::function<py::array_t<float, py::array::c_style | py::array::forcecast>(
-        void)>;
 using np_array_f32 =
     py::array_t<float, py::array::c_style | py::array::forcecast>;
 
@@ -131,27 +131,37 @@ class ResamplingException : public std::exception {
   std::string message = "";
 };
 
+// Names of the converter types, indexed by their libsamplerate value.
+const char *const converter_type_names[] = {
+    "sinc_best", "sinc_medium", "sinc_fastest", "zero_order_hold", "linear"};
+const int num_converter_types = 5;
+
 int get_converter_type(const py::object &obj) {
   if (py::isinstance<py::str>(obj)) {
-    py::str py_s = obj;
-    std::string s = static_cast<std::string>(py_s);
-    if (s.compare("sinc_best") == 0) {
-      return 0;
-    } else if (s.compare("sinc_medium") == 0) {
-      return 1;
-    } else if (s.compare("sinc_fastest") == 0) {
-      return 2;
-    } else if (s.compare("zero_order_hold") == 0) {
-      return 3;
-    } else if (s.compare("linear") == 0) {
-      return 4;
+    // String literals in Python code are interned, so comparing against
+    // interned copies of the names resolves the common case by identity.
+    // These references are kept for the lifetime of the process.
+    static PyObject *const *interned_names = [] {
+      static PyObject *names[num_converter_types];
+      for (int i = 0; i < num_converter_types; ++i)
+        names[i] = PyUnicode_InternFromString(converter_type_names[i]);
+      return names;
+    }();
+
+    for (int i = 0; i < num_converter_types; ++i) {
+      if (obj.ptr() == interned_names[i]) return i;
+    }
+    // fall back to comparing the contents for strings built at runtime
+    for (int i = 0; i < num_converter_types; ++i) {
+      if (PyUnicode_CompareWithASCIIString(obj.ptr(), converter_type_names[i]) == 0)
+        return i;
     }
   } else if (py::isinstance<py::int_>(obj)) {
     py::int_ val = obj;
     return static_cast<int>(val);
   } else if (py::isinstance<ConverterType>(obj)) {
-    py::int_ c = obj.attr("value");
-    return static_cast<int>(c);
+    // read the C++ enum directly rather than going through `.value`
+    return static_cast<int>(obj.cast<ConverterType>());
   }
 
   throw std::domain_error("Unsupported converter type");
@@ -168,9 +178,193 @@ void error_handler(int errnum) {
   }
 }
 
+// libsamplerate's error code for an invalid ratio, which samplerate.h does
+// not export
+constexpr int SRC_ERR_BAD_SRC_RATIO = 6;
+
+// Raises the error libsamplerate reports for an invalid conversion ratio.
+// src_is_valid_ratio accepts NaN, as it fails both range comparisons.
+void check_ratio(double ratio) {
+  if (!std::isfinite(ratio) || !src_is_valid_ratio(ratio))
+    error_handler(SRC_ERR_BAD_SRC_RATIO);
+}
+
+// Input frames handed to libsamplerate.
+//
+// float32 arrays in C order are used in place, without going through NumPy's
+// conversion machinery. Other float32 and float64 arrays with one or two
+// dimensions, such as float64 data (the NumPy default) or a channel sliced out
+// of a multi-channel array, are gathered into a float32 buffer owned by this
+// object by `data()`: no intermediate NumPy array is created and the GIL is
+// not needed, so this can run in the released-GIL region together with the
+// resampling. Any other input is converted by NumPy.
+class InputFrames {
+ public:
+  explicit InputFrames(const py::object &input) : _array(as_array(input)) {
+    if (can_gather<float>()) {
+      _source = (_array.flags() & py::array::c_style) ? Source::borrowed
+                                                       : Source::gather_f32;
+    } else if (can_gather<double>()) {
+      _source = Source::gather_f64;
+    } else if (!py::isinstance<np_array_f32>(_array)) {
+      _array = convert(_array);
+    }
+
+    _size = static_cast<size_t>(_array.size());
+    for (py::ssize_t dim = 0; dim < _array.ndim() && dim < 2; ++dim) {
+      _shape[dim] = _array.shape(dim);
+      _strides[dim] = _array.strides(dim) / static_cast<py::ssize_t>(
+          _source == Source::gather_f64 ? sizeof(double) : sizeof(float));
+    }
+  }
+
+  py::ssize_t ndim() const { return _array.ndim(); }
+  py::ssize_t shape(py::ssize_t dim) const { return _array.shape(dim); }
+
+  // Pointer to the C-ordered float32 samples. Does not require the GIL.
+  const float *data() {
+    if (_source == Source::borrowed)
+      return static_cast<const float *>(_array.data());
+    if (!_buffer) {
+      _buffer.reset(new float[_size > 0 ? _size : 1]);
+      if (_source == Source::gather_f64)
+        gather(static_cast<const double *>(_array.data()), _buffer.get());
+      else
+        gather(static_cast<const float *>(_array.data()), _buffer.get());
+    }
+    return _buffer.get();
+  }
+
+ private:
+  enum class Source { borrowed, gather_f32, gather_f64 };
+
+  // arrays are used as is, anything else is converted by NumPy
+  static py::array as_array(const py::object &input) {
+    if (py::isinstance<py::array>(input))
+      return py::reinterpret_borrow<py::array>(input);
+    return convert(input);
+  }
+
+  // Converts through NumPy. Values NumPy cannot convert, such as strings,
+  // are reported as TypeError, the error raised for a bad argument type.
+  static np_array_f32 convert(const py::object &input) {
+    try {
+      return np_array_f32(input);
+    } catch (py::error_already_set &e) {
+      if (!e.matches(PyExc_ValueError)) throw;
+      py::raise_from(e, PyExc_TypeError,
+                     "Input data cannot be converted to a float32 array.");
+      throw py::error_already_set();
+    }
+  }
+
+  // whether the array can be read directly as elements of type T
+  template <typename T>
+  bool can_gather() const {
+    if (!py::isinstance<py::array_t<T>>(_array)) return false;
+    if (_array.ndim() < 1 || _array.ndim() > 2) return false;
+    if (reinterpret_cast<std::uintptr_t>(_array.data()) % alignof(T) != 0)
+      return false;
+    for (py::ssize_t dim = 0; dim < _array.ndim(); ++dim) {
+      if (_array.strides(dim) % static_cast<py::ssize_t>(sizeof(T)) != 0)
+        return false;
+    }
+    return true;
+  }
+
+  template <typename T>
+  void gather(const T *src, float *dst) const {
+    if (_strides[1] == 1 && _strides[0] == _shape[1]) {
+      // C order: a plain loop, which the compiler vectorizes for the target
+      for (size_t i = 0; i < _size; ++i) dst[i] = static_cast<float>(src[i]);
+      return;
+    }
+    for (py::ssize_t frame = 0; frame < _shape[0]; ++frame) {
+      const T *src_frame = src + frame * _strides[0];
+      for (py::ssize_t channel = 0; channel < _shape[1]; ++channel)
+        *dst++ = static_cast<float>(src_frame[channel * _strides[1]]);
+    }
+  }
+
+  py::array _array;
+  Source _source = Source::borrowed;
+  size_t _size = 0;
+  // frames and channels, with strides in elements; a 1D array is one channel
+  py::ssize_t _shape[2] = {0, 1};
+  py::ssize_t _strides[2] = {1, 1};
+  std::unique_ptr<float[]> _buffer;
+};
+
 class Resampler {
  private:
   SRC_STATE *_state = nullptr;
+  // Serializes access to the converter state, which is used without the GIL
+  // held when `release_gil` is in effect. Each instance has its own mutex;
+  // copies and moves start with a fresh one.
+  mutable std::mutex _state_mutex;
+
+  // Locks the converter state. If another thread holds the lock and the
+  // calling thread holds the GIL, the GIL is released while waiting, so that
+  // other Python threads keep running.
+  std::unique_lock<std::mutex> lock_state(bool gil_held = true) const {
+    std::unique_lock<std::mutex> lock(_state_mutex, std::try_to_lock);
+    if (lock.owns_lock()) return lock;
+    if (!gil_held) {
+      lock.lock();
+      return lock;
+    }
+    py::gil_scoped_release release;
+    lock.lock();
+    return lock;
+  }
+
+  // number of channels of the input, which must match the resampler
+  int input_channels(const InputFrames &input) const {
+    int channels = 1;
+    if (input.ndim() == 2)
+      channels = input.shape(1);
+    else if (input.ndim() > 2)
+      throw std::domain_error("Input array should have at most 2 dimensions");
+
+    if (channels != _channels || channels == 0)
+      throw std::domain_error("Invalid number of channels in input data.");
+    return channels;
+  }
+
+  // Resamples `input` into `data_out`, which holds `output_frames` frames,
+  // and returns the libsamplerate struct with the frame counts filled in.
+  SRC_DATA process_frames(InputFrames &input, double sr_ratio, float *data_out,
+                          long output_frames, bool end_of_input,
+                          const py::object &release_gil) {
+    // libsamplerate struct
+    SRC_DATA src_data = {
+        nullptr,                            // data_in, set below
+        data_out,                           // data_out
+        static_cast<long>(input.shape(0)),  // input_frames
+        output_frames,                      // output_frames
+        0,             // input_frames_used, filled by libsamplerate
+        0,             // output_frames_gen, filled by libsamplerate
+        end_of_input,  // end_of_input
+        sr_ratio       // src_ratio, sampling rate conversion ratio
+    };
+
+    // Perform resampling with optional GIL release
+    auto do_resample = [&](bool gil_held) {
+      src_data.data_in = input.data();
+      auto lock = lock_state(gil_held);
+      return src_process(_state, &src_data);
+    };
+
+    int err_code;
+    if (should_release_gil(release_gil, input.shape(0))) {
+      py::gil_scoped_release release;
+      err_code = do_resample(false);
+    } else {
+      err_code = do_resample(true);
+    }
+    error_handler(err_code);
+    return src_data;
+  }
 
  public:
   int _converter_type = 0;
@@ -189,7 +383,10 @@ class Resampler {
   Resampler(const Resampler &r)
       : _converter_type(r._converter_type), _channels(r._channels) {
     int _err_num = 0;
-    _state = src_clone(r._state, &_err_num);
+    {
+      auto lock = r.lock_state();
+      _state = src_clone(r._state, &_err_num);
+    }
     error_handler(_err_num);
   }
 
@@ -206,21 +403,10 @@ class Resampler {
   ~Resampler() { src_delete(_state); }  // src_delete handles nullptr case
 
   py::array_t<float, py::array::c_style> process(
-      const py::array_t<float, py::array::c_style | py::array::forcecast> &input,
-      double sr_ratio, bool end_of_input,
+      const py::object &input_data, double sr_ratio, bool end_of_input,
       const py::object &release_gil = py::none()) {
-    // accessors for the arrays
-    py::buffer_info inbuf = input.request();
-
-    // set the number of channels
-    int channels = 1;
-    if (inbuf.ndim == 2)
-      channels = inbuf.shape[1];
-    else if (inbuf.ndim > 2)
-      throw std::domain_error("Input array should have at most 2 dimensions");
-
-    if (channels != _channels || channels == 0)
-      throw std::domain_error("Invalid number of channels in input data.");
+    InputFrames input(input_data);
+    const int channels = input_channels(input);
 
     // Add a "fudge factor" to the size. This is because the actual number of
     // output samples generated on the last call when input is terminated can
@@ -229,41 +415,19 @@ class Resampler {
     // of output samples generated will generally be zero or otherwise less
     // than the number of samples in mid-stream processing.)
     const auto new_size =
-        static_cast<size_t>(std::ceil(inbuf.shape[0] * sr_ratio))
+        static_cast<size_t>(std::ceil(input.shape(0) * sr_ratio))
         + END_OF_INPUT_EXTRA_OUTPUT_FRAMES;
 
     // allocate output array
     std::vector<size_t> out_shape{new_size};
-    if (inbuf.ndim == 2) out_shape.push_back(static_cast<size_t>(channels));
+    if (input.ndim() == 2) out_shape.push_back(static_cast<size_t>(channels));
     auto output = py::array_t<float, py::array::c_style>(out_shape);
     py::buffer_info outbuf = output.request();
 
-    // libsamplerate struct
-    SRC_DATA src_data = {
-        static_cast<float *>(inbuf.ptr),   // data_in
-        static_cast<float *>(outbuf.ptr),  // data_out
-        static_cast<long>(inbuf.shape[0]), // input_frames
-        long(new_size),                    // output_frames
-        0,             // input_frames_used, filled by libsamplerate
-        0,             // output_frames_gen, filled by libsamplerate
-        end_of_input,  // end_of_input, not used by src_simple ?
-        sr_ratio       // src_ratio, sampling rate conversion ratio
-    };
-
-    // Perform resampling with optional GIL release
-    auto do_resample = [&]() {
-      return src_process(_state, &src_data);
-    };
-
-    int err_code;
-    if (should_release_gil(release_gil, inbuf.shape[0])) {
-      py::gil_scoped_release release;
-      err_code = do_resample();
-    } else {
-      err_code = do_resample();
-    }
-    long output_frames_gen = src_data.output_frames_gen;
-    error_handler(err_code);
+    long output_frames_gen =
+        process_frames(input, sr_ratio, static_cast<float *>(outbuf.ptr),
+                       long(new_size), end_of_input, release_gil)
+            .output_frames_gen;
 
     // create a shorter view of the array
     if ((size_t)output_frames_gen < new_size) {
@@ -277,11 +441,49 @@ class Resampler {
     return output;
   }
 
+  py::tuple process_into(
+      const py::object &input_data, double sr_ratio,
+      py::array_t<float, py::array::c_style> &output, bool end_of_input,
+      const py::object &release_gil = py::none()) {
+    InputFrames input(input_data);
+    const int channels = input_channels(input);
+
+    // the output array is written in place, so it must hold frames of the
+    // same number of channels as the input
+    if (output.ndim() < 1 || output.ndim() > 2 ||
+        (output.ndim() == 2 && output.shape(1) != channels) ||
+        (output.ndim() < 2 && channels != 1))
+      throw std::domain_error("Invalid shape of output array.");
+
+    // raises if the output array is read-only
+    SRC_DATA src_data =
+        process_frames(input, sr_ratio, output.mutable_data(),
+                       static_cast<long>(output.shape(0)), end_of_input,
+                       release_gil);
+
+    // libsamplerate stops consuming input once the output is full, so the
+    // caller needs the number of frames used to pass the rest on the next call
+    return py::make_tuple(src_data.output_frames_gen,
+                          src_data.input_frames_used);
+  }
+
   void set_ratio(double new_ratio) {
-    error_handler(src_set_ratio(_state, new_ratio));
+    int err_code;
+    {
+      auto lock = lock_state();
+      err_code = src_set_ratio(_state, new_ratio);
+    }
+    error_handler(err_code);
   }
 
-  void reset() { error_handler(src_reset(_state)); }
+  void reset() {
+    int err_code;
+    {
+      auto lock = lock_state();
+      err_code = src_reset(_state);
+    }
+    error_handler(err_code);
+  }
 
   Resampler clone() const { return Resampler(*this); }
 };
@@ -295,7 +497,7 @@ long the_callback_func(void *cb_data, float **data);
 class CallbackResampler {
  private:
   SRC_STATE *_state = nullptr;
-  callback_t _callback = nullptr;
+  py::object _callback;
   np_array_f32 _current_buffer;
   size_t _buffer_ndim = 0;
   std::string _callback_error_msg = "";
@@ -321,7 +523,7 @@ class CallbackResampler {
   }
 
  public:
-  CallbackResampler(const callback_t &callback_func, double ratio,
+  CallbackResampler(const py::function &callback_func, double ratio,
                     const py::object &converter_type, size_t channels)
       : _callback(callback_func),
         _ratio(ratio),
@@ -344,7 +546,7 @@ class CallbackResampler {
   // move constructor
   CallbackResampler(CallbackResampler &&r)
       : _state(r._state),
-        _callback(r._callback),
+        _callback(std::move(r._callback)),
         _current_buffer(std::move(r._current_buffer)),
         _buffer_ndim(r._buffer_ndim),
         _callback_error_msg(std::move(r._callback_error_msg)),
@@ -352,7 +554,6 @@ class CallbackResampler {
         _converter_type(r._converter_type),
         _channels(r._channels) {
     r._state = nullptr;
-    r._callback = nullptr;
     r._buffer_ndim = 0;
     r._ratio = 0.0;
     r._converter_type = 0;
@@ -369,16 +570,26 @@ class CallbackResampler {
   std::string get_callback_error() const { return _callback_error_msg; }
   void clear_callback_error() { _callback_error_msg = ""; }
 
-  np_array_f32 callback(void) {
-    auto input = _callback();
-
-    auto inbuf = input.request();
-    if (_buffer_ndim == 0) _buffer_ndim = inbuf.ndim;
-
-    _current_buffer = input;
-    return input;
+  // Fetch the next input frames from the Python callback into the current
+  // buffer. Returns false at the end of the stream. Requires the GIL.
+  bool callback(void) {
+    // PyObject_CallNoArgs goes through vectorcall without building an
+    // argument tuple
+    auto input = py::reinterpret_steal<py::object>(
+        PyObject_CallNoArgs(_callback.ptr()));
+    if (!input) throw py::error_already_set();
+
+    // end of stream is signaled by a None
+    if (input.is_none()) return false;
+
+    // the converting constructor raises NumPy's error for bad values
+    _current_buffer = np_array_f32(input);
+    if (_buffer_ndim == 0) _buffer_ndim = _current_buffer.ndim();
+    return true;
   }
 
+  const np_array_f32 &current_buffer() const { return _current_buffer; }
+
   py::array_t<float, py::array::c_style> read(
       size_t frames, const py::object &release_gil = py::none()) {
     // allocate output array
@@ -445,7 +656,31 @@ class CallbackResampler {
     _ratio = new_ratio;
   }
 
-  void reset() { error_handler(src_reset(_state)); }
+  void reset(const py::object &callback_func = py::none(),
+             const py::object &ratio = py::none()) {
+    // validate both arguments before changing anything
+    if (!callback_func.is_none() && !PyCallable_Check(callback_func.ptr()))
+      throw py::type_error("`callback` must be callable or None.");
+    double new_ratio = _ratio;
+    if (!ratio.is_none()) {
+      new_ratio = PyFloat_AsDouble(ratio.ptr());
+      if (new_ratio == -1.0 && PyErr_Occurred()) throw py::error_already_set();
+      check_ratio(new_ratio);
+    }
+
+    if (!callback_func.is_none()) {
+      _callback = callback_func;
+      // the new callback may return arrays of a different shape
+      _buffer_ndim = 0;
+    }
+    _ratio = new_ratio;
+
+    // a fresh state, e.g. after leaving a `with` block, is already reset
+    if (_state == nullptr)
+      _create();
+    else
+      error_handler(src_reset(_state));
+  }
 
   CallbackResampler clone() const { return CallbackResampler(*this); }
   CallbackResampler &__enter__() { return *this; }
@@ -461,24 +696,22 @@ long the_callback_func(void *cb_data, float **data) {
   CallbackResampler *cb = static_cast<CallbackResampler *>(cb_data);
   int cb_channels = cb->get_channels();
 
-  py::buffer_info inbuf;
-  {
-    py::gil_scoped_acquire acquire;
+  // the input array is only inspected while the GIL is held
+  py::gil_scoped_acquire acquire;
 
-    // get the data as a numpy array
-    auto input = cb->callback();
-    inbuf = input.request();
-  }
+  // get the data as a numpy array; it is kept alive as the current buffer
+  // while libsamplerate reads from it, which ends before the next callback
+  if (!cb->callback()) return 0;
+  const np_array_f32 &input = cb->current_buffer();
 
-  // end of stream is signaled by a None, which is cast to a ndarray with ndim
-  // == 0
-  if (inbuf.ndim == 0) return 0;
+  // a scalar also ends the stream
+  if (input.ndim() == 0) return 0;
 
   // set the number of channels
   int channels = 1;
-  if (inbuf.ndim == 2)
-    channels = inbuf.shape[1];
-  else if (inbuf.ndim > 2) {
+  if (input.ndim() == 2)
+    channels = input.shape(1);
+  else if (input.ndim() > 2) {
     // Cannot throw exception in C callback - store error and return 0
     cb->set_callback_error("Input array should have at most 2 dimensions");
     return 0;
@@ -490,28 +723,27 @@ long the_callback_func(void *cb_data, float **data) {
     return 0;
   }
 
-  *data = static_cast<float *>(inbuf.ptr);
+  *data = const_cast<float *>(input.data());
 
-  return (long)inbuf.shape[0];
+  return (long)input.shape(0);
 }
 
 }  // namespace
 
 py::array_t<float, py::array::c_style> resample(
-    const py::array_t<float, py::array::c_style | py::array::forcecast> &input,
-    double sr_ratio, const py::object &converter_type, bool verbose,
+    const py::object &input_data, double sr_ratio,
+    const py::object &converter_type, bool verbose,
     const py::object &release_gil = py::none()) {
   // input array has shape (n_samples, n_channels)
   int converter_type_int = get_converter_type(converter_type);
 
-  // accessors for the arrays
-  py::buffer_info inbuf = input.request();
+  InputFrames input(input_data);
 
   // set the number of channels
   int channels = 1;
-  if (inbuf.ndim == 2)
-    channels = inbuf.shape[1];
-  else if (inbuf.ndim > 2)
+  if (input.ndim() == 2)
+    channels = input.shape(1);
+  else if (input.ndim() > 2)
     throw std::domain_error("Input array should have at most 2 dimensions");
 
   if (channels == 0)
@@ -521,20 +753,20 @@ py::array_t<float, py::array::c_style> resample(
   // src_simple internally behaves like end_of_input=True, so it may generate
   // extra samples from buffer flushing, especially for certain converters
   const auto new_size =
-      static_cast<size_t>(std::ceil(inbuf.shape[0] * sr_ratio))
+      static_cast<size_t>(std::ceil(input.shape(0) * sr_ratio))
       + END_OF_INPUT_EXTRA_OUTPUT_FRAMES;
 
   // allocate output array
   std::vector<size_t> out_shape{new_size};
-  if (inbuf.ndim == 2) out_shape.push_back(static_cast<size_t>(channels));
+  if (input.ndim() == 2) out_shape.push_back(static_cast<size_t>(channels));
   auto output = py::array_t<float, py::array::c_style>(out_shape);
   py::buffer_info outbuf = output.request();
 
   // libsamplerate struct
   SRC_DATA src_data = {
-      static_cast<float *>(inbuf.ptr),   // data_in
+      nullptr,                           // data_in, set below
       static_cast<float *>(outbuf.ptr),  // data_out
-      static_cast<long>(inbuf.shape[0]), // input_frames
+      static_cast<long>(input.shape(0)), // input_frames
       long(new_size),                    // output_frames
       0,        // input_frames_used, filled by libsamplerate
       0,        // output_frames_gen, filled by libsamplerate
@@ -544,11 +776,12 @@ py::array_t<float, py::array::c_style> resample(
 
   // Perform resampling with optional GIL release
   auto do_resample = [&]() {
+    src_data.data_in = input.data();
     return src_simple(&src_data, converter_type_int, channels);
   };
 
   int err_code;
-  if (should_release_gil(release_gil, inbuf.shape[0])) {
+  if (should_release_gil(release_gil, input.shape(0))) {
     py::gil_scoped_release release;
     err_code = do_resample();
   } else {
@@ -576,6 +809,125 @@ py::array_t<float, py::array::c_style> resample(
   return output;
 }
 
+py::array_t<float, py::array::c_style> resample_batch(
+    const py::object &input_data, double sr_ratio,
+    const py::object &converter_type,
+    const py::object &release_gil = py::none()) {
+  // input array has shape (n_signals, n_samples)
+  int converter_type_int = get_converter_type(converter_type);
+
+  InputFrames input(input_data);
+
+  if (input.ndim() != 2)
+    throw std::domain_error(
+        "Input array should have 2 dimensions (num_signals, num_frames)");
+
+  const auto num_signals = static_cast<size_t>(input.shape(0));
+  const auto num_frames = static_cast<long>(input.shape(1));
+
+  // the ratio sizes the buffers below, so it is checked first
+  check_ratio(sr_ratio);
+
+  // Same buffer space as resample(), since every signal is flushed with
+  // end_of_input set.
+  const auto new_size =
+      static_cast<size_t>(std::ceil(num_frames * sr_ratio))
+      + END_OF_INPUT_EXTRA_OUTPUT_FRAMES;
+  std::vector<float> scratch(new_size);
+  // The output length only depends on the number of frames, so an empty
+  // batch takes it from resampling a silent signal.
+  std::vector<float> silence(num_signals == 0 ? std::max(num_frames, 1L) : 0);
+
+  // A single converter state is reset between signals, instead of creating
+  // and destroying one per signal as src_simple does.
+  int err_num = 0;
+  std::unique_ptr<SRC_STATE, SRC_STATE *(*)(SRC_STATE *)> state(
+      src_new(converter_type_int, 1, &err_num), src_delete);
+  error_handler(err_num);
+
+  // resample one signal into `data_out`, which holds `output_frames` frames
+  auto do_resample = [&](const float *data_in, float *data_out,
+                         long output_frames, long &output_frames_gen) {
+    int err_code = src_reset(state.get());
+    if (err_code != 0) return err_code;
+
+    // libsamplerate struct
+    SRC_DATA src_data = {
+        data_in,                        // data_in
+        data_out,                       // data_out
+        num_frames,                     // input_frames
+        output_frames,                  // output_frames
+        0,        // input_frames_used, filled by libsamplerate
+        0,        // output_frames_gen, filled by libsamplerate
+        1,        // end_of_input, as in src_simple
+        sr_ratio  // src_ratio, sampling rate conversion ratio
+    };
+    err_code = src_process(state.get(), &src_data);
+    output_frames_gen = src_data.output_frames_gen;
+    return err_code;
+  };
+
+  py::array_t<float, py::array::c_style> output;
+  bool too_many_frames = false;
+  bool length_mismatch = false;
+  auto do_resample_all = [&]() {
+    const float *data_in = num_signals == 0 ? silence.data() : input.data();
+
+    // the first signal determines the length of all outputs
+    long output_frames = 0;
+    int err_code =
+        do_resample(data_in, scratch.data(), long(new_size), output_frames);
+    if (err_code != 0) return err_code;
+    if ((size_t)output_frames >= new_size) {
+      // This means our fudge factor is too small.
+      too_many_frames = true;
+      return 0;
+    }
+
+    float *out_ptr;
+    {
+      // allocating the output array needs the GIL, if it was released
+      py::gil_scoped_acquire acquire;
+      output = py::array_t<float, py::array::c_style>(std::vector<size_t>{
+          num_signals, static_cast<size_t>(output_frames)});
+      out_ptr = output.mutable_data();
+    }
+    if (num_signals == 0) return 0;
+    std::copy_n(scratch.data(), output_frames, out_ptr);
+
+    // the other signals are resampled straight into their row
+    for (size_t i = 1; i < num_signals; ++i) {
+      long output_frames_gen = 0;
+      err_code = do_resample(data_in + i * num_frames,
+                             out_ptr + i * output_frames, output_frames,
+                             output_frames_gen);
+      if (err_code != 0) return err_code;
+      if (output_frames_gen != output_frames) {
+        length_mismatch = true;
+        break;
+      }
+    }
+    return 0;
+  };
+
+  // Gather the input and resample all signals with optional GIL release
+  int err_code;
+  if (should_release_gil(release_gil, (long)num_signals * num_frames)) {
+    py::gil_scoped_release release;
+    err_code = do_resample_all();
+  } else {
+    err_code = do_resample_all();
+  }
+  error_handler(err_code);
+
+  if (too_many_frames)
+    throw std::runtime_error("Generated more output samples than expected!");
+  if (length_mismatch)
+    throw std::runtime_error("Resampled signals have different lengths!");
+
+  return output;
+}
+
 }  // namespace samplerate
 
 namespace sr = samplerate;
@@ -717,6 +1069,39 @@ dict
                    "input"_a, "ratio"_a, "converter_type"_a = "sinc_best",
                    "verbose"_a = false, "release_gil"_a = py::none());
 
+  m_converters.def("resample_batch", &sr::resample_batch, R"mydelimiter(
+    Resample a batch of single-channel signals at once.
+
+    All signals are resampled independently with the same ratio and
+    converter, in a single call. This is much faster than calling `resample`
+    in a loop when there are many short signals.
+
+    Parameters
+    ----------
+    input_data : ndarray
+        Input data, a 2D array of shape (`num_signals`, `num_frames`) where
+        each row is a separate single-channel signal.
+        For use with `libsamplerate`, `input_data`
+        is converted to 32-bit float and C (row-major) memory order.
+    ratio : float
+        Conversion ratio = output sample rate / input sample rate.
+    converter_type : ConverterType, str, or int
+        Sample rate converter (default: `sinc_best`).
+    release_gil : bool, str, or None
+        Controls GIL release during resampling for multi-threading:
+        - `None` or `"auto"` (default): Release GIL only for large data (>= 1000 frames in total)
+        - `True`: Always release GIL (best for multi-threaded applications)
+        - `False`: Never release GIL (best for single-threaded, small data)
+
+    Returns
+    -------
+    output_data : ndarray
+        Resampled signals, as a (`num_signals`, `num_output_frames`) array.
+        Each row is identical to the result of `resample` on that signal.
+  )mydelimiter",
+                   "input"_a, "ratio"_a, "converter_type"_a = "sinc_best",
+                   "release_gil"_a = py::none());
+
   py::class_<sr::Resampler>(m_converters, "Resampler", R"mydelimiter(
     Resampler.
 
@@ -758,6 +1143,47 @@ dict
             Resampled input data.
       )mydelimiter",
            "input"_a, "ratio"_a, "end_of_input"_a = false, "release_gil"_a = py::none())
+      .def("process_into", &sr::Resampler::process_into, R"mydelimiter(
+        Resample the signal in `input_data` into a preallocated array.
+
+        This avoids allocating a new output array on every call, which is
+        useful when processing many small chunks.
+
+        Parameters
+        ----------
+        input_data : ndarray
+            Input data, as for `process`.
+        ratio : float
+            Conversion ratio = output sample rate / input sample rate.
+        output : ndarray
+            C-contiguous, writable 32-bit float array receiving the resampled
+            frames. Its shape is (`max_frames`, `num_channels`), or
+            (`max_frames`,) for a single channel.
+        end_of_input : int
+            Set to `True` if no more data is available, or to `False` otherwise.
+        release_gil : bool, str, or None
+            Controls GIL release during resampling for multi-threading:
+            - `None` or `"auto"` (default): Release GIL only for large data (>= 1000 frames)
+            - `True`: Always release GIL (best for multi-threaded applications)
+            - `False`: Never release GIL (best for single-threaded, small data)
+
+        Returns
+        -------
+        num_output_frames : int
+            Number of frames written to the beginning of `output`.
+        num_input_frames_used : int
+            Number of frames of `input_data` consumed by the converter.
+
+        Notes
+        -----
+        Conversion stops when `output` is full, without raising. Input frames
+        that were not consumed must be passed again on the next call. When
+        `end_of_input` is `True`, keep calling with the remaining (possibly
+        empty) input until no more output frames are generated, so that the
+        frames buffered inside the converter are flushed.
+      )mydelimiter",
+           "input"_a, "ratio"_a, py::arg("output").noconvert(),
+           "end_of_input"_a = false, "release_gil"_a = py::none())
       .def("reset", &sr::Resampler::reset, "Reset internal state.")
       .def("set_ratio", &sr::Resampler::set_ratio,
            "Set a new conversion ratio immediately.")
@@ -782,6 +1208,10 @@ dict
         A single channel can be provided as a 1D array of `num_frames` length.
         For use with `libsamplerate`, `input_data` is converted to 32-bit float and
         C (row-major) memory order.
+        A 32-bit float C-contiguous array is used in place without a copy,
+        and it is only read until the next call of the callback. The
+        callback may therefore return the same, possibly read-only, array on
+        every call.
     ratio : float
         Conversion ratio = output sample rate / input sample rate.
     converter_type : ConverterType, str, or int
@@ -789,7 +1219,7 @@ dict
     channels : int
         Number of channels.
     )mydelimiter")
-      .def(py::init<const callback_t &, double, const py::object &, int>(),
+      .def(py::init<const py::function &, double, const py::object &, int>(),
            "callback"_a, "ratio"_a, "converter_type"_a = "sinc_best",
            "channels"_a = 1)
       .def(py::init<sr::CallbackResampler>())
@@ -814,7 +1244,21 @@ dict
                 than requested, for example when no more input is available.
            )mydelimiter",
            "num_frames"_a, "release_gil"_a = py::none())
-      .def("reset", &sr::CallbackResampler::reset, "Reset state.")
+      .def("reset", &sr::CallbackResampler::reset, R"mydelimiter(
+            Reset state, optionally replacing the callback and ratio.
+
+            This allows one resampler to be reused for a new stream instead
+            of creating a new object.
+
+            Parameters
+            ----------
+            callback : function, optional
+                New function that returns input frames, see `CallbackResampler`.
+                By default, the current callback is kept.
+            ratio : float, optional
+                New conversion ratio. By default, the current ratio is kept.
+           )mydelimiter",
+           "callback"_a = py::none(), "ratio"_a = py::none())
       .def("set_starting_ratio", &sr::CallbackResampler::set_starting_ratio,
            "Set the starting conversion ratio for the next `read` call.")
       .def("clone", &sr::CallbackResampler::clone,
@@ -846,6 +1290,7 @@ dict
   // Convenience imports
   m.attr("ResamplingError") = m_exceptions.attr("ResamplingError");
   m.attr("resample") = m_converters.attr("resample");
+  m.attr("resample_batch") = m_converters.attr("resample_batch");
   m.attr("CallbackResampler") = m_converters.attr("CallbackResampler");
   m.attr("Resampler") = m_converters.attr("Resampler");
   m.attr("ConverterType") = m_converters.attr("ConverterType");
@@ -39,6 +39,13 @@ def resample(
     release_gil: Optional[Union[bool, str]] = None,
 ) -> npt.NDArray[np.float32]: ...
 
+def resample_batch(
+    input_data: npt.NDArray[np.float32],
+    ratio: float,
+    converter_type: Union[ConverterType, str, int] = "sinc_best",
+    release_gil: Optional[Union[bool, str]] = None,
+) -> npt.NDArray[np.float32]: ...
+
 class Resampler:
     converter_type: int
     channels: int
@@ -54,6 +61,14 @@ class Resampler:
         end_of_input: bool = False,
         release_gil: Optional[Union[bool, str]] = None,
     ) -> npt.NDArray[np.float32]: ...
+    def process_into(
+        self,
+        input_data: npt.NDArray[np.float32],
+        ratio: float,
+        output: npt.NDArray[np.float32],
+        end_of_input: bool = False,
+        release_gil: Optional[Union[bool, str]] = None,
+    ) -> Tuple[int, int]: ...
     def reset(self) -> None: ...
     def set_ratio(self, new_ratio: float) -> None: ...
     def clone(self) -> "Resampler": ...
@@ -74,7 +89,11 @@ class CallbackResampler:
         num_frames: int,
         release_gil: Optional[Union[bool, str]] = None,
     ) -> npt.NDArray[np.float32]: ...
-    def reset(self) -> None: ...
+    def reset(
+        self,
+        callback: Optional[Callable[[], Optional[npt.NDArray[np.float32]]]] = None,
+        ratio: Optional[float] = None,
+    ) -> None: ...
     def set_starting_ratio(self, new_ratio: float) -> None: ...
     def clone(self) -> "CallbackResampler": ...
     def __enter__(self) -> "CallbackResampler": ...
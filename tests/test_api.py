@@ -9,12 +9,14 @@ def test_aliases():
         Resampler,
         CallbackResampler,
         resample,
+        resample_batch,
         ConverterType,
     )
     from samplerate import (
         Resampler,
         CallbackResampler,
         resample,
+        resample_batch,
         ConverterType,
         ResamplingError,
     )
@@ -45,6 +47,77 @@ def test_simple(data, converter_type, ratio=2.0):
     samplerate.resample(input_data, ratio, converter_type)
 
 
+def test_resample_batch(converter_type, ratio=2.0):
+    periods = np.linspace(0, 10, 1000)
+    batch = np.stack([np.sin(2 * np.pi * periods + i) for i in range(5)])
+    output = samplerate.resample_batch(batch, ratio, converter_type)
+    for signal, output_signal in zip(batch, output):
+        expected = samplerate.resample(signal, ratio, converter_type)
+        assert output_signal.shape == expected.shape
+        assert np.allclose(output_signal, expected)
+
+
+@pytest.mark.parametrize("release_gil", [False, True])
+def test_resample_batch_strided(converter_type, release_gil, ratio=2.0):
+    periods = np.linspace(0, 10, 1000)
+    batch = np.stack([np.sin(2 * np.pi * periods + i) for i in range(5)])
+    # float64 Fortran-order input is gathered together with the resampling
+    output = samplerate.resample_batch(
+        np.asfortranarray(batch), ratio, converter_type, release_gil=release_gil
+    )
+    expected = samplerate.resample_batch(
+        batch.astype(np.float32), ratio, converter_type
+    )
+    assert np.allclose(output, expected)
+
+
+def test_resample_batch_empty(converter_type, ratio=2.0):
+    signal = np.sin(2 * np.pi * np.linspace(0, 10, 1000))
+    expected = samplerate.resample(signal, ratio, converter_type)
+    # an empty batch has the output length of its signals
+    output = samplerate.resample_batch(
+        np.empty((0, signal.shape[0])), ratio, converter_type
+    )
+    assert output.shape == (0, expected.shape[0])
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int16])
+@pytest.mark.parametrize("stride", [1, 2])
+def test_input_conversion(data, converter_type, dtype, stride, ratio=2.0):
+    num_channels, input_data = data
+    input_data = (1000 * input_data).astype(dtype)[::stride]
+    # reference computed from a float32 C-contiguous copy, used as is
+    reference_data = np.ascontiguousarray(input_data, dtype=np.float32)
+
+    expected = samplerate.resample(reference_data, ratio, converter_type)
+    assert np.allclose(samplerate.resample(input_data, ratio, converter_type), expected)
+
+    resampler = samplerate.Resampler(converter_type, channels=num_channels)
+    output = resampler.process(input_data, ratio, end_of_input=True)
+    assert np.allclose(output, expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_input_channel_slice(converter_type, dtype, ratio=2.0):
+    periods = np.linspace(0, 10, 1000)
+    stereo = np.stack([np.sin(2 * np.pi * periods), np.cos(2 * np.pi * periods)], axis=1)
+    stereo = stereo.astype(dtype)
+    for channel in range(2):
+        # a non-contiguous view of one channel
+        input_data = stereo[:, channel]
+        expected = samplerate.resample(
+            np.ascontiguousarray(input_data, dtype=np.float32), ratio, converter_type
+        )
+        output = samplerate.resample(input_data, ratio, converter_type)
+        assert np.allclose(output, expected)
+    # Fortran order
+    expected = samplerate.resample(
+        np.ascontiguousarray(stereo, dtype=np.float32), ratio, converter_type
+    )
+    output = samplerate.resample(np.asfortranarray(stereo), ratio, converter_type)
+    assert np.allclose(output, expected)
+
+
 def test_process(data, converter_type, ratio=2.0):
     num_channels, input_data = data
     src = samplerate.Resampler(converter_type, num_channels)
@@ -59,6 +132,47 @@ def test_match(data, converter_type, ratio=2.0):
     assert np.allclose(output_simple, output_full)
 
 
+def test_process_into(data, converter_type, ratio=2.0):
+    num_channels, input_data = data
+    resampler = samplerate.Resampler(converter_type, channels=num_channels)
+    expected = resampler.process(input_data, ratio, end_of_input=True)
+
+    resampler.reset()
+    output = np.empty(
+        (expected.shape[0] + 100,) + expected.shape[1:], dtype=np.float32
+    )
+    num_frames, num_used = resampler.process_into(
+        input_data, ratio, output, end_of_input=True
+    )
+    assert num_used == input_data.shape[0]
+    assert num_frames == expected.shape[0]
+    assert np.allclose(output[:num_frames], expected)
+
+
+def test_process_into_small_output(data, converter_type, ratio=2.0):
+    num_channels, input_data = data
+    resampler = samplerate.Resampler(converter_type, channels=num_channels)
+    expected = resampler.process(input_data, ratio, end_of_input=True)
+
+    # the output holds far fewer frames than the whole signal, so the
+    # unconsumed input is fed again until the converter is flushed
+    resampler.reset()
+    output = np.empty((300,) + expected.shape[1:], dtype=np.float32)
+    chunks = []
+    remaining = input_data
+    for _ in range(10 * expected.shape[0] // output.shape[0] + 10):
+        num_frames, num_used = resampler.process_into(
+            remaining, ratio, output, end_of_input=True
+        )
+        remaining = remaining[num_used:]
+        chunks.append(output[:num_frames].copy())
+        if num_frames == 0 and remaining.shape[0] == 0:
+            break
+    result = np.concatenate(chunks)
+    assert result.shape == expected.shape
+    assert np.allclose(result, expected)
+
+
 def test_callback(data, converter_type, ratio=2.0):
     _, input_data = data
 
@@ -74,6 +188,60 @@ def test_callback(data, converter_type, ratio=2.0):
     resampler.read(int(ratio) * input_data.shape[0])
 
 
+def test_callback_callable_object(data, converter_type, ratio=2.0):
+    _, input_data = data
+
+    class Producer:
+        def __init__(self):
+            self.done = False
+
+        def __call__(self):
+            if self.done:
+                return None
+            self.done = True
+            return input_data
+
+        def next_chunk(self):
+            return self()
+
+    channels = input_data.shape[-1] if input_data.ndim == 2 else 1
+    num_frames = int(ratio) * input_data.shape[0]
+
+    # callable instances and bound methods are called like functions
+    outputs = [
+        samplerate.CallbackResampler(
+            callback, ratio, converter_type, channels
+        ).read(num_frames)
+        for callback in [Producer(), Producer().next_chunk]
+    ]
+    assert np.allclose(outputs[0], outputs[1])
+
+
+def test_callback_readonly_reused_buffer(converter_type, ratio=2.0):
+    chunk = np.sin(np.linspace(0, 10, 256)).astype(np.float32)
+    chunk.flags.writeable = False
+    num_chunks = 8
+
+    def make_callback(copy):
+        def producer():
+            for _ in range(num_chunks):
+                # the same read-only array on every call, or fresh copies
+                yield chunk.copy() if copy else chunk
+            while True:
+                yield None
+
+        return lambda p=producer(): next(p)
+
+    num_frames = int(ratio) * num_chunks * chunk.shape[0]
+    expected = samplerate.CallbackResampler(
+        make_callback(copy=True), ratio, converter_type
+    ).read(num_frames)
+    output = samplerate.CallbackResampler(
+        make_callback(copy=False), ratio, converter_type
+    ).read(num_frames)
+    assert np.allclose(output, expected)
+
+
 def test_callback_with(data, converter_type, ratio=2.0):
     from samplerate import CallbackResampler
 
@@ -119,6 +287,38 @@ def test_callback_with_2x(data, converter_type, ratio=2.0):
     resampler.read(int(ratio) * input_data.shape[0] // 2)
 
 
+def test_callback_reset(data, converter_type, ratio=2.0):
+    from samplerate import CallbackResampler
+
+    _, input_data = data
+
+    def make_callback():
+        def producer():
+            yield input_data
+            while True:
+                yield None
+
+        return lambda p=producer(): next(p)
+
+    channels = input_data.shape[-1] if input_data.ndim == 2 else 1
+    num_frames = int(ratio) * input_data.shape[0]
+
+    expected = CallbackResampler(
+        make_callback(), ratio, converter_type, channels
+    ).read(num_frames)
+
+    with CallbackResampler(
+        make_callback(), 0.5, converter_type, channels
+    ) as resampler:
+        resampler.read(num_frames)
+
+    # reuse the resampler for a new stream, also after leaving the with block
+    for _ in range(2):
+        resampler.reset(make_callback(), ratio)
+        assert resampler.ratio == ratio
+        assert np.allclose(resampler.read(num_frames), expected)
+
+
 def test_Resampler_clone():
     resampler = samplerate.Resampler("sinc_best", 1)
     new_resampler = resampler.clone()
@@ -164,3 +364,20 @@ def test_CallbackResampler_clone(data, converter_type, ratio=2.0):
 def test_converter_type(input_obj, expected_type):
     ret = samplerate._internals.get_converter_type(input_obj)
     assert ret == expected_type
+
+
+@pytest.mark.parametrize(
+    "name,expected_type",
+    [
+        ("sinc_best", 0),
+        ("sinc_medium", 1),
+        ("sinc_fastest", 2),
+        ("zero_order_hold", 3),
+        ("linear", 4),
+    ],
+)
+def test_converter_type_runtime_string(name, expected_type):
+    # strings built at runtime are not interned and take the slow path
+    runtime_name = "".join(list(name))
+    ret = samplerate._internals.get_converter_type(runtime_name)
+    assert ret == expected_type
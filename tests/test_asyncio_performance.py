@@ -147,7 +147,7 @@ async def test_asyncio_threadpool_parallel(event_loop, num_concurrent, converter
     ratio = 2.0
     
     num_samples = int(fs * duration)
-    data = np.random.randn(num_samples).astype(np.float32)
+    data = np.random.default_rng(42).standard_normal(num_samples, dtype=np.float32)
     
     # Sequential baseline - run tasks one at a time
     start = time.perf_counter()
@@ -209,7 +209,7 @@ async def test_asyncio_no_executor_blocks(event_loop, converter_type):
     ratio = 2.0
     
     num_samples = int(fs * duration)
-    data = np.random.randn(num_samples).astype(np.float32)
+    data = np.random.default_rng(42).standard_normal(num_samples, dtype=np.float32)
     
     # Run two tasks "concurrently" but without executor (blocks event loop)
     async def blocking_resample():
@@ -264,7 +264,7 @@ async def test_asyncio_processpool_comparison(event_loop, num_concurrent):
     converter_type = "sinc_fastest"
     
     num_samples = int(fs * duration)
-    data = np.random.randn(num_samples).astype(np.float32)
+    data = np.random.default_rng(42).standard_normal(num_samples, dtype=np.float32)
     
     # ThreadPoolExecutor (benefits from GIL release)
     thread_executor = ThreadPoolExecutor(max_workers=num_concurrent)
@@ -314,7 +314,7 @@ async def test_asyncio_mixed_workload(event_loop):
     converter_type = "sinc_fastest"
     
     num_samples = int(fs * duration)
-    data = np.random.randn(num_samples).astype(np.float32)
+    data = np.random.default_rng(42).standard_normal(num_samples, dtype=np.float32)
     
     async def io_task(delay):
         """Simulate I/O operation."""
@@ -367,7 +367,7 @@ async def test_asyncio_performance_report():
     duration = 5.0
     ratio = 2.0
     num_samples = int(fs * duration)
-    data = np.random.randn(num_samples).astype(np.float32)
+    data = np.random.default_rng(42).standard_normal(num_samples, dtype=np.float32)
     
     print(f"\nTest Configuration:")
     print(f"  Sample rate: {fs} Hz")
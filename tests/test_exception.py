@@ -43,6 +43,24 @@ def test_resample_zero_len_input():
     samplerate.resample(data, 0.5, "sinc_fastest")
 
 
+@pytest.mark.parametrize(
+    "data",
+    ["abc", ["a", "b", "c"], np.array(["a", "b", "c"], dtype=object)],
+    ids=["str", "list", "object-array"],
+)
+def test_unconvertible_input(data):
+    # all fail because the input cannot be converted to float32
+    with pytest.raises(TypeError):
+        samplerate.resample(data, 2.0, "linear")
+    resampler = samplerate.Resampler("linear", 1)
+    with pytest.raises(TypeError):
+        resampler.process(data, 2.0)
+    with pytest.raises(TypeError):
+        resampler.process_into(data, 2.0, np.empty(100, dtype=np.float32))
+    with pytest.raises(TypeError):
+        samplerate.resample_batch(data, 2.0, "linear")
+
+
 def test_resample_ndim_too_big():
     data = np.zeros((16000, 1, 1), dtype=np.float32)
     with pytest.raises(ValueError):
@@ -50,6 +68,21 @@ def test_resample_ndim_too_big():
         samplerate.resample(data, 0.5, "sinc_fastest")
 
 
+def test_resample_batch_ndim():
+    data = np.zeros(16000, dtype=np.float32)
+    with pytest.raises(ValueError):
+        # fails because the input is not a batch of signals
+        samplerate.resample_batch(data, 0.5, "sinc_fastest")
+
+
+@pytest.mark.parametrize("ratio", [float("nan"), -2.0, 257.0])
+def test_resample_batch_invalid_ratio(ratio):
+    data = np.zeros((4, 16000), dtype=np.float32)
+    with pytest.raises(samplerate.ResamplingError):
+        # fails because the ratio is out of range
+        samplerate.resample_batch(data, ratio, "sinc_fastest")
+
+
 def test_resampler_ndim_too_big():
     data = np.zeros((16000, 1, 1), dtype=np.float32)
     resampler = samplerate.Resampler("sinc_fastest", 1)
@@ -66,6 +99,35 @@ def test_resampler_incorrect_channel_number():
         resampler.process(data, 0.5)
 
 
+def test_resampler_process_into_invalid_output():
+    data = np.zeros(1000, dtype=np.float32)
+    resampler = samplerate.Resampler("sinc_fastest", 1)
+    with pytest.raises(TypeError):
+        # fails because the output is not float32, it would be silently copied
+        resampler.process_into(data, 2.0, np.empty(4000, dtype=np.float64))
+    with pytest.raises(ValueError):
+        # fails because the output has 2 channels
+        resampler.process_into(data, 2.0, np.empty((4000, 2), dtype=np.float32))
+    with pytest.raises(ValueError):
+        # fails because the output has no frame axis
+        resampler.process_into(data, 2.0, np.empty((), dtype=np.float32))
+    readonly = np.empty(4000, dtype=np.float32)
+    readonly.flags.writeable = False
+    with pytest.raises(ValueError):
+        # fails because the output cannot be written to
+        resampler.process_into(data, 2.0, readonly)
+
+
+def test_resampler_process_invalid_ratio_type():
+    data = np.zeros(1000, dtype=np.float32)
+    resampler = samplerate.Resampler("linear", 1)
+    with pytest.raises(TypeError):
+        # fails because the ratio is not a number
+        resampler.process(data, "2.0")
+    with pytest.raises(TypeError):
+        resampler.process_into(data, "2.0", np.empty(4000, dtype=np.float32))
+
+
 def test_callback_resampler_ndim_too_big():
     data = np.zeros((16000, 1, 1), dtype=np.float32)
 
@@ -82,6 +144,35 @@ def test_callback_resampler_ndim_too_big():
         cb_resampler.read(len(data))
 
 
+def test_callback_resampler_unconvertible_input():
+    cb_resampler = samplerate.CallbackResampler(
+        lambda: "abc", 0.5, "sinc_fastest", 1
+    )
+    with pytest.raises(ValueError):
+        # fails because the callback result cannot be converted to float32
+        cb_resampler.read(100)
+
+
+def test_callback_resampler_reset_invalid():
+    cb_resampler = samplerate.CallbackResampler(
+        lambda: None, 0.5, "sinc_fastest", 1
+    )
+    with pytest.raises(TypeError):
+        # fails because the ratio is not a number
+        cb_resampler.reset(ratio="2.0")
+    with pytest.raises(TypeError):
+        # fails because the callback is not callable
+        cb_resampler.reset(callback=1)
+    with pytest.raises(samplerate.ResamplingError):
+        # fails because the ratio is out of range
+        cb_resampler.reset(ratio=-1.0)
+    with pytest.raises(samplerate.ResamplingError):
+        # fails because the ratio is not finite
+        cb_resampler.reset(ratio=float("nan"))
+    # nothing was changed by the failed calls
+    assert cb_resampler.ratio == 0.5
+
+
 def test_callback_resampler_incorrect_channel_number():
     data = np.zeros((16000, 2), dtype=np.float32)
 